@@ -89,6 +89,7 @@ setup(
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
+        "re2": ["google-re2"],
     },
     entry_points={
         "console_scripts": [
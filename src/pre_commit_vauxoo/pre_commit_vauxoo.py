@@ -1,5 +1,9 @@
 import ast
+import concurrent.futures
+import functools
 import glob
+import hashlib
+import json
 import logging
 import os
 import re
@@ -11,12 +15,8 @@ from . import __version__, logging_colored
 
 _logger = logging.getLogger("pre-commit-vauxoo")
 
-re_export = re.compile(
-    r"^(?P<export>export|EXPORT)( )+"
-    + r"(?P<variable>[\w]*)[ ]*[\=][ ]*[\"\']{0,1}"
-    + r"(?P<value>[\w\.\-\_/\$\{\}\:,\(\)\#\* ]*)[\"\']{0,1}",
-    re.M,
-)
+# Lines of .pre-commit-config* files replaced by copy_cfg_files
+re_precommit_marker = re.compile(r"# EXCLUDE_LINT|--disable=R0000")
 
 
 def full_norm_path(path):
@@ -36,15 +36,27 @@ def get_is_ci():
 
 
 def get_repo():
-    repo_root = subprocess.check_output(["git", "rev-parse", "--show-toplevel"]).decode(sys.stdout.encoding).strip()
-    repo_root = full_norm_path(repo_root)
-    return repo_root
+    return _get_repo(os.getcwd())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_repo(cwd):
+    """Cached by current directory to avoid running git again for the same repo.
+    "--show-toplevel" returns an absolute canonical path, so only normalize the separators
+    """
+    repo_root = subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel"], cwd=cwd, encoding="utf-8", errors="surrogateescape"
+    ).strip()
+    return os.path.normpath(repo_root)
 
 
 def get_files(path):
-    ls_files = subprocess.check_output(["git", "ls-files", "--", path]).decode(sys.stdout.encoding).strip()
-    ls_files = ls_files.splitlines()
-    return ls_files
+    # "-z" uses NUL as separator and disables quoting, so filenames with spaces, quotes or newlines are preserved
+    # "surrogateescape" allows to pass non-utf-8 filenames back to the command line unchanged
+    ls_files = subprocess.check_output(
+        ["git", "ls-files", "-z", "--", path], encoding="utf-8", errors="surrogateescape"
+    )
+    return ls_files.split("\0")[:-1]
 
 
 def git_cwd():
@@ -53,7 +65,9 @@ def git_cwd():
     directory.
     Return "." if it is the top-level
     """
-    res = subprocess.check_output(["git", "rev-parse", "--show-prefix", "."]).decode(sys.stdout.encoding).strip()
+    res = subprocess.check_output(
+        ["git", "rev-parse", "--show-prefix", "."], encoding="utf-8", errors="surrogateescape"
+    ).strip()
     git_path_rel = res.splitlines()[0].rstrip("/" + os.sep)
     return git_path_rel
 
@@ -76,6 +90,43 @@ def get_uninstallable_modules(src_path) -> set:
     return results
 
 
+def get_cfg_fingerprint(src_stat, dst, cfg_args):
+    """Fingerprint of a configuration file copied by copy_cfg_files.
+    It changes if the source file, the copied file or the arguments used to generate it are changed
+
+    :return: The hexdigest or None if the copied file does not exist
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return None
+    fingerprint = (src_stat.st_mtime_ns, src_stat.st_size, dst_stat.st_mtime_ns, dst_stat.st_size, cfg_args)
+    return hashlib.blake2b(repr(fingerprint).encode(), digest_size=16).hexdigest()
+
+
+def load_cfg_cache(cache_path):
+    if not os.path.isfile(cache_path):
+        return {}
+    try:
+        with open(cache_path) as f_cache:
+            cfg_cache = json.load(f_cache)
+    except (OSError, ValueError):
+        _logger.debug("Unable to read the cache file %s. Copying all the configuration files", cache_path)
+        return {}
+    return cfg_cache if isinstance(cfg_cache, dict) else {}
+
+
+def save_cfg_cache(cache_path, cfg_cache):
+    if not os.path.isdir(os.path.dirname(cache_path)):
+        # e.g. ".git" is a file for worktrees and submodules
+        return
+    try:
+        with open(cache_path, "w") as f_cache:
+            json.dump(cfg_cache, f_cache)
+    except OSError:
+        _logger.debug("Unable to write the cache file %s", cache_path)
+
+
 def copy_cfg_files(
     precommit_config_dir,
     repo_dirname,
@@ -88,50 +139,97 @@ def copy_cfg_files(
 ):
     exclude_lint_regex = ""
     exclude_autofix_regex = ""
-    if exclude_lint:
-        exclude_lint_regex = "(%s)|" % "|".join(
-            [re.escape(exclude_path.strip()) for exclude_path in exclude_lint if exclude_path and exclude_path.strip()]
-        )
-    if exclude_autofix:
-        exclude_autofix_regex = "(%s)|" % "|".join(
-            [
-                re.escape(exclude_path.strip())
-                for exclude_path in exclude_autofix
-                if exclude_path and exclude_path.strip()
-            ]
-        )
+    exclude_lint_parts = [re.escape(path.strip()) for path in exclude_lint if path and path.strip()]
+    if exclude_lint_parts:
+        exclude_lint_regex = "(%s)|" % "|".join(exclude_lint_parts)
+    exclude_autofix_parts = [re.escape(path.strip()) for path in exclude_autofix if path and path.strip()]
+    if exclude_autofix_parts:
+        exclude_autofix_regex = "(%s)|" % "|".join(exclude_autofix_parts)
     _logger.info("Copying configuration files 'cp -rnT %s/ %s/", precommit_config_dir, repo_dirname)
-    for fname in os.listdir(precommit_config_dir):
-        src = os.path.join(precommit_config_dir, fname)
-        if not os.path.isfile(src):
-            # if it is not a file skip
-            continue
+    # Stored inside ".git" to avoid showing it as an untracked file of the repo
+    cfg_cache_path = os.path.join(repo_dirname, ".git", "pre-commit-vauxoo.cache")
+    cfg_cache_old = load_cfg_cache(cfg_cache_path)
+    cfg_cache = {}
+    cfg_args = (
+        __version__,
+        exclude_lint,
+        pylint_disable_checks,
+        exclude_autofix,
+        skip_string_normalization,
+        odoo_version,
+    )
+    with os.scandir(precommit_config_dir) as entries:
+        # DirEntry.is_file uses the file type from readdir instead of a new stat per entry
+        cfg_entries = [entry for entry in entries if entry.is_file()]
+    for entry in cfg_entries:
+        fname, src = entry.name, entry.path
         dst = os.path.join(repo_dirname, fname)
         if no_overwrite and os.path.isfile(dst):
             # Use the custom files defined in the repo
             _logger.warning("Using custom file %s", dst)
             continue
-        with open(src) as fsrc, open(dst, "w") as fdst:
-            for line in fsrc:
-                if fname.startswith(".pre-commit-config") and "# EXCLUDE_LINT" in line:
+        if fname in cfg_cache_old and cfg_cache_old[fname] == get_cfg_fingerprint(entry.stat(), dst, cfg_args):
+            # Neither the source, the copied file nor the arguments changed since the last copy
+            cfg_cache[fname] = cfg_cache_old[fname]
+            continue
+        # Resolve the per-file branches once instead of once per line
+        is_precommit = fname.startswith(".pre-commit-config")
+        apply_exclude_lint = bool(exclude_lint_regex) and is_precommit
+        apply_exclude_autofix = bool(exclude_autofix_regex) and fname == ".pre-commit-config-autofix.yaml"
+        apply_disable = bool(pylint_disable_checks) and is_precommit
+        is_pyproject = fname == "pyproject.toml"
+        apply_odoo_version = bool(odoo_version) and fname.startswith(".pylintrc")
+        if not (is_precommit or is_pyproject or apply_odoo_version):
+            # Nothing to replace, so copy it as-is without parsing each line (using sendfile where available)
+            shutil.copyfile(src, dst)
+        else:
+            with open(src) as fsrc:
+                lines = fsrc.readlines()
+            for index, line in enumerate(lines):
+                marker = re_precommit_marker.search(line) if is_precommit else None
+                if marker and marker.group() == "# EXCLUDE_LINT":
                     line = ""
-                    if exclude_lint:
+                    if apply_exclude_lint:
                         _logger.info("Applying EXCLUDE_LINT=%s to %s", exclude_lint, dst)
                         line += "    %s\n" % exclude_lint_regex
-                    if fname == ".pre-commit-config-autofix.yaml" and exclude_autofix:
+                    if apply_exclude_autofix:
                         _logger.info("Applying EXCLUDE_AUTOFIX=%s to %s", exclude_autofix, dst)
                         line += "    %s\n" % exclude_autofix_regex
-                if pylint_disable_checks and fname.startswith(".pre-commit-config") and "--disable=R0000" in line:
+                elif marker and apply_disable:
                     _logger.info(
                         "Disabling the following pylint checks (PYLINT_DISABLE_CHECKS): %s", pylint_disable_checks
                     )
                     line = line.replace("R0000", ",".join(pylint_disable_checks))
-                if fname == "pyproject.toml" and line.startswith("skip-string-normalization"):
+                if is_pyproject and line.startswith("skip-string-normalization"):
                     line = "skip-string-normalization=%s\n" % (skip_string_normalization and "true" or "false")
-                if fname.startswith(".pylintrc"):
-                    if "# External scripts odoo_lint replace" in line and odoo_version:
-                        line += "valid-odoo-version=%s\n" % odoo_version
-                fdst.write(line)
+                if apply_odoo_version and "# External scripts odoo_lint replace" in line:
+                    line += "valid-odoo-version=%s\n" % odoo_version
+                lines[index] = line
+            # Write the whole file at once instead of one write call per line
+            with open(dst, "w") as fdst:
+                fdst.write("".join(lines))
+        cfg_cache[fname] = get_cfg_fingerprint(entry.stat(), dst, cfg_args)
+    save_cfg_cache(cfg_cache_path, cfg_cache)
+
+
+@functools.lru_cache(maxsize=None)
+def get_re_export():
+    """Compiled only the first time it is used since it is only needed to source variables.sh"""
+    try:
+        # google-re2 matches in linear time so a malformed variables.sh can not cause catastrophic backtracking
+        # Imported here to avoid loading the C extension when variables.sh is not parsed
+        import re2 as re_export_engine  # pylint: disable=import-outside-toplevel
+
+        # RE2 "\w" only matches ASCII, so use the unicode classes matched by "\w" of "re" to get the same result
+        word_chars = r"\pL\pN_"
+    except ImportError:
+        re_export_engine = re
+        word_chars = r"\w"
+    return re_export_engine.compile(
+        r"(?m)^(?:export|EXPORT)[ \t]+"
+        + r"(?P<variable>[%s]+)[ \t]*=[ \t]*[\"\']?" % word_chars
+        + r"(?P<value>[%s\.\-/\$\{\}\:,\(\)\#\* ]*)[\"\']?" % word_chars
+    )
 
 
 def envfile2envdict(repo_dirname, source_file="variables.sh", no_overwrite_environ=True):
@@ -145,23 +243,137 @@ def envfile2envdict(repo_dirname, source_file="variables.sh", no_overwrite_envir
         return envdict
     with open(source_file_path) as f_source_file:
         _logger.info("Running 'source %s'", source_file)
-        for line in f_source_file:
-            line_match = re_export.match(line)
-            if not line_match:
-                continue
-            line_match = line_match.groupdict()  # py3.5 comp
-            if no_overwrite_environ and line_match["variable"] in os.environ:
-                continue
-            envdict.update({line_match["variable"]: line_match["value"]})
+        source_content = f_source_file.read()
+    envdict = {
+        line_match.group("variable"): line_match.group("value")
+        for line_match in get_re_export().finditer(source_content)
+        if not (no_overwrite_environ and line_match.group("variable") in os.environ)
+    }
     return envdict
 
 
+def merge_precommit_cfgs(cfg_paths):
+    """Merge the 'repos' of the pre-commit configuration files in a single configuration
+    in order to install all their hooks using only one 'pre-commit install-hooks' command
+
+    :return: The merged configuration dictionary or None if they can not be merged.
+        e.g. a file is not found or they are using a different 'default_language_version'
+    """
+    # Imported here to avoid loading yaml when the hooks are not installed e.g. "--install"
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    # Same C accelerated class used by pre-commit if it is available
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    merged_cfg = None
+    for cfg_path in cfg_paths:
+        if not os.path.isfile(cfg_path):
+            return None
+        with open(cfg_path) as f_cfg:
+            try:
+                cfg = yaml.load(f_cfg, Loader=yaml_loader)
+            except yaml.YAMLError:
+                _logger.warning("Unable to parse %s. Installing its hooks separately", cfg_path)
+                return None
+        if not isinstance(cfg, dict) or not isinstance(cfg.get("repos"), list):
+            return None
+        if merged_cfg is None:
+            merged_cfg = cfg
+            continue
+        if cfg.get("default_language_version") != merged_cfg.get("default_language_version"):
+            return None
+        merged_cfg["repos"] += cfg["repos"]
+    return merged_cfg
+
+
+def save_precommit_cfg(cfg, cfg_path):
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    with open(cfg_path, "w") as f_cfg:
+        yaml.dump(cfg, f_cfg, Dumper=yaml_dumper)
+
+
 def subprocess_call(command, *args, **kwargs):
-    cmd_str = " ".join(command)
-    _logger.debug("Running command: %s", cmd_str)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Running command: %s", " ".join(command))
     return subprocess.call(command, *args, **kwargs)
 
 
+def subprocess_call_cmds(commands):
+    """Run the commands one by one e.g. the same pre-commit command for each chunk of files
+    return 0 if all of them passed or the exit code of the last one failed
+    """
+    exit_code = 0
+    for command in commands:
+        exit_code = subprocess_call(command) or exit_code
+    return exit_code
+
+
+def subprocess_call_captured(commands):
+    """Run the commands one by one capturing their stdout and stderr in the same buffer
+    to show it later using print_captured
+    It allows to run commands concurrently without mixing their outputs
+    return tuple (exit_code, output)
+    """
+    exit_code, output = 0, b""
+    for command in commands:
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Running command: %s", " ".join(command))
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False)
+        exit_code = process.returncode or exit_code
+        output += process.stdout
+    return exit_code, output
+
+
+def get_arg_max():
+    """Max number of bytes available for the arguments of a new process"""
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        # e.g. Windows has not sysconf and its limit of 32767 characters is only for the command line
+        return 32767
+    # The environment uses the same space than the arguments
+    env_size = sum(len(var) + len(value) + 2 for var, value in os.environ.items())
+    return arg_max - env_size - 4096
+
+
+def split_files_cmds(command, files, extra_args=()):
+    """Split the "--files" arguments in several commands to avoid the error "Argument list too long" (E2BIG)
+    Duplicated files are removed keeping the order
+    extra_args are added after the files of each command e.g. ["-c", pre_commit_cfg]
+    return list of commands
+    """
+    extra_args = list(extra_args)
+    # Each argument uses its bytes, the NUL terminator and the pointer of argv
+    max_size = get_arg_max() - sum(len(os.fsencode(arg)) + 1 + 8 for arg in command + ["--files"] + extra_args)
+    commands = []
+    chunk, chunk_size = [], 0
+    for fname in dict.fromkeys(files):
+        fname_size = len(os.fsencode(fname)) + 1 + 8
+        if chunk and chunk_size + fname_size > max_size:
+            commands.append(command + ["--files"] + chunk + extra_args)
+            chunk, chunk_size = [], 0
+        chunk.append(fname)
+        chunk_size += fname_size
+    commands.append(command + ["--files"] + chunk + extra_args)
+    return commands
+
+
+def get_run_cmds(command, files, pre_commit_cfg):
+    """Commands to run pre-commit with the configuration file for the files or all of them if files is None"""
+    if files is None:
+        return [command + ["--all", "-c", pre_commit_cfg]]
+    return split_files_cmds(command, files, ["-c", pre_commit_cfg])
+
+
+def print_captured(future):
+    """Wait for the subprocess_call_captured future, show its output and return its exit code"""
+    exit_code, output = future.result()
+    sys.stdout.write(output.decode("utf-8", "replace"))
+    sys.stdout.flush()
+    return exit_code
+
+
 # There are a lot of if validations in this method. It is expected for now.
 # pylint: disable=too-complex
 def main(
@@ -194,7 +406,7 @@ def main(
 
     precommit_config_dir = os.path.join(root_dir, "cfg")
     uninstallable_modules = get_uninstallable_modules(repo_dirname)
-    exclude_lint += tuple(uninstallable_modules)
+    exclude_lint += tuple(sorted(uninstallable_modules))
 
     copy_cfg_files(
         precommit_config_dir,
@@ -211,12 +423,34 @@ def main(
     pre_commit_cfg_mandatory = os.path.join(repo_dirname, ".pre-commit-config.yaml")
     pre_commit_cfg_optional = os.path.join(repo_dirname, ".pre-commit-config-optional.yaml")
     pre_commit_cfg_autofix = os.path.join(repo_dirname, ".pre-commit-config-autofix.yaml")
+    # Mandatory checks are not skipped since a missing file must fail the build
+    for hooks_type, pre_commit_cfg in (("optional", pre_commit_cfg_optional), ("fix", pre_commit_cfg_autofix)):
+        if hooks_type in precommit_hooks_type and not os.path.isfile(pre_commit_cfg):
+            # Avoid to spawn pre-commit only to fail because the file does not exist
+            _logger.warning("Skipping %s checks because %s was not found", hooks_type, pre_commit_cfg)
+            precommit_hooks_type = tuple(i for i in precommit_hooks_type if i != hooks_type)
+    install_cfgs = []
     if "mandatory" in precommit_hooks_type:
-        subprocess_call(cmd + ["-c", pre_commit_cfg_mandatory])
+        install_cfgs.append(pre_commit_cfg_mandatory)
     if "optional" in precommit_hooks_type:
-        subprocess_call(cmd + ["-c", pre_commit_cfg_optional])
+        install_cfgs.append(pre_commit_cfg_optional)
     if "fix" in precommit_hooks_type:
-        subprocess_call(cmd + ["-c", pre_commit_cfg_autofix])
+        install_cfgs.append(pre_commit_cfg_autofix)
+    # pre-commit stores the path of each config used in its database so a fixed path is used to avoid adding a new
+    # row for each run. It is stored inside ".git" to avoid showing it as an untracked file of the repo
+    pre_commit_cfg_merged = os.path.join(repo_dirname, ".git", "pre-commit-config-merged.yaml")
+    merged_cfg = None
+    if len(install_cfgs) > 1 and os.path.isdir(os.path.dirname(pre_commit_cfg_merged)):
+        merged_cfg = merge_precommit_cfgs(install_cfgs)
+    if merged_cfg:
+        # Install all the hooks using only one pre-commit process
+        save_precommit_cfg(merged_cfg, pre_commit_cfg_merged)
+        subprocess_call(cmd + ["-c", pre_commit_cfg_merged])
+    else:
+        # "pre-commit install-hooks" only accepts one "-c"
+        # Running them concurrently does not help since pre-commit locks its store during the whole install
+        for pre_commit_cfg in install_cfgs:
+            subprocess_call(cmd + ["-c", pre_commit_cfg])
 
     status = 0
     cmd = ["pre-commit", "run", "--color=always"]
@@ -231,21 +465,24 @@ def main(
         files = get_files(os.path.join(repo_dirname, cwd))
         if not files:
             raise UserWarning("Not files detected in current path %s" % cwd)
-        cmd.extend(["--files"] + files)
+        run_files = files
     elif paths and paths != (".",):
         _logger.info("Running only for INCLUDE_LINT=%s", paths)
         included_files = []
         for included_path in paths:
             included_files += get_files(included_path) or (included_path,)
-        cmd.extend(["--files"] + included_files)
+        run_files = included_files
     else:
-        cmd.append("--all")
+        run_files = None
     all_status = {}
 
     if "fix" in precommit_hooks_type:
-        _logger.info("%s AUTOFIX CHECKS %s", "-" * 25, "-" * 25)
-        _logger.info("Running autofix checks (affect status build but you can autofix them locally)")
-        autofix_status = subprocess_call(cmd + ["-c", pre_commit_cfg_autofix])
+        _logger.info(
+            "%s AUTOFIX CHECKS %s\nRunning autofix checks (affect status build but you can autofix them locally)",
+            "-" * 25,
+            "-" * 25,
+        )
+        autofix_status = subprocess_call_cmds(get_run_cmds(cmd, run_files, pre_commit_cfg_autofix))
         status += autofix_status
         test_name = "Autofix checks"
         all_status[test_name] = {"status": autofix_status}
@@ -256,11 +493,11 @@ def main(
                 # Similar to https://github.com/pre-commit/pre-commit/blob/3fe38df/pre_commit/commands/run.py#L306
                 # But using a custom message related to pre-commit-vauxoo instead of pre-commit
                 # and limit the output
-                diff = (
-                    subprocess.check_output(["git", "--no-pager", "diff", "--no-ext-diff", "--color=always"])
-                    .decode(sys.stdout.encoding)
-                    .strip()[:2000]
-                )
+                diff = subprocess.check_output(
+                    ["git", "--no-pager", "diff", "--no-ext-diff", "--color=always"],
+                    encoding="utf-8",
+                    errors="replace",
+                ).strip()[:2000]
                 msg_info = {
                     "ci_name": is_ci[1],
                     "py_version": "%s.%s" % (sys.version_info.major, sys.version_info.minor),
@@ -302,10 +539,23 @@ def main(
             all_status[test_name]["status_msg"] = "Passed"
         _logger.info("-" * 66)
 
+    # Autofix checks modify the files so they run alone before the others
+    # Mandatory and optional checks only read the files so they can run concurrently
+    run_futures = {}
+    if "mandatory" in precommit_hooks_type and "optional" in precommit_hooks_type:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        for pre_commit_cfg in (pre_commit_cfg_mandatory, pre_commit_cfg_optional):
+            run_futures[pre_commit_cfg] = executor.submit(
+                subprocess_call_captured, get_run_cmds(cmd, run_files, pre_commit_cfg)
+            )
+        executor.shutdown(wait=False)
+
     if "mandatory" in precommit_hooks_type:
-        _logger.info("%s MANDATORY CHECKS %s", "*" * 25, "*" * 25)
-        _logger.info("Running mandatory checks (affect status build)")
-        mandatory_status = subprocess_call(cmd + ["-c", pre_commit_cfg_mandatory])
+        _logger.info("%s MANDATORY CHECKS %s\nRunning mandatory checks (affect status build)", "*" * 25, "*" * 25)
+        if pre_commit_cfg_mandatory in run_futures:
+            mandatory_status = print_captured(run_futures[pre_commit_cfg_mandatory])
+        else:
+            mandatory_status = subprocess_call_cmds(get_run_cmds(cmd, run_files, pre_commit_cfg_mandatory))
         status += mandatory_status
         test_name = "Mandatory checks"
         all_status[test_name] = {"status": mandatory_status}
@@ -319,10 +569,16 @@ def main(
             all_status[test_name]["status_msg"] = "Passed"
 
     if "optional" in precommit_hooks_type:
-        _logger.info("*" * 68)
-        _logger.info("%s OPTIONAL CHECKS %s", "~" * 25, "~" * 25)
-        _logger.info("Running optional checks (does not affect status build)")
-        status_optional = subprocess_call(cmd + ["-c", os.path.join(repo_dirname, pre_commit_cfg_optional)])
+        _logger.info(
+            "%s\n%s OPTIONAL CHECKS %s\nRunning optional checks (does not affect status build)",
+            "*" * 68,
+            "~" * 25,
+            "~" * 25,
+        )
+        if pre_commit_cfg_optional in run_futures:
+            status_optional = print_captured(run_futures[pre_commit_cfg_optional])
+        else:
+            status_optional = subprocess_call_cmds(get_run_cmds(cmd, run_files, pre_commit_cfg_optional))
         test_name = "Optional checks"
         all_status[test_name] = {"status": status_optional}
         if status_optional != 0 and fail_optional:
@@ -350,11 +606,7 @@ def print_summary(all_status):
     summary_msg.append("|  Tests summary:")
     summary_msg.append("|" + "-" * 39)
     for test_name, test_result in all_status.items():
-        outcome = (
-            logging_colored.colorized_msg(test_result["status_msg"], test_result["level"])
-            if test_result["status"] != 0
-            else logging_colored.colorized_msg(test_result["status_msg"], test_result["level"])
-        )
+        outcome = logging_colored.colorized_msg(test_result["status_msg"], test_result["level"])
         summary_msg.append("| {:<28}{}".format(test_name, outcome))
     summary_msg.append("+" + "=" * 39)
     _logger.info("Tests summary\n%s", "\n".join(summary_msg))
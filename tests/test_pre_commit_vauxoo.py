@@ -1,3 +1,4 @@
+import importlib.util
 import logging
 import os
 import shutil
@@ -7,9 +8,11 @@ import tempfile
 import unittest
 from contextlib import contextmanager
 from distutils.dir_util import copy_tree  # pylint:disable=deprecated-module
+from unittest import mock
 
 from click.testing import CliRunner
 
+from pre_commit_vauxoo import pre_commit_vauxoo
 from pre_commit_vauxoo.cli import main
 
 
@@ -177,6 +180,150 @@ class TestPreCommitVauxoo(unittest.TestCase):
             "Uninstallable module should not have been linted. Exited with error %s - %s" % (result, result.output),
         )
 
+    def test_copy_cfg_files_cache(self):
+        precommit_config_dir = os.path.join(os.path.dirname(pre_commit_vauxoo.__file__), "cfg")
+        args = (precommit_config_dir, self.tmp_dir, False, ("module_example1",), (), (), False, None)
+        pylintrc = os.path.join(self.tmp_dir, ".pylintrc")
+        cache_path = os.path.join(self.tmp_dir, ".git", "pre-commit-vauxoo.cache")
+        pre_commit_vauxoo.copy_cfg_files(*args)
+        self.assertTrue(os.path.isfile(cache_path), "Cache not saved")
+        pylintrc_mtime = os.stat(pylintrc).st_mtime_ns
+
+        pre_commit_vauxoo.copy_cfg_files(*args)
+        self.assertEqual(os.stat(pylintrc).st_mtime_ns, pylintrc_mtime, "Unchanged file copied again")
+
+        with open(pylintrc, "w") as f_pylintrc:
+            f_pylintrc.write("# Modified")
+        pre_commit_vauxoo.copy_cfg_files(*args)
+        with open(pylintrc) as f_pylintrc:
+            self.assertNotEqual(f_pylintrc.read(), "# Modified", "Modified file was not copied again")
+
+        pre_commit_vauxoo.copy_cfg_files(*args[:6] + (True, None))
+        with open(os.path.join(self.tmp_dir, "pyproject.toml")) as f_pyproject:
+            self.assertIn("skip-string-normalization=true", f_pyproject.read(), "New arguments were not applied")
+
+    def write_precommit_cfg(self, fname, content):
+        cfg_path = os.path.join(self.tmp_dir, fname)
+        with open(cfg_path, "w") as f_cfg:
+            f_cfg.write(content)
+        return cfg_path
+
+    def test_merge_precommit_cfgs(self):
+        cfg1 = self.write_precommit_cfg(
+            "cfg1.yaml", "default_language_version:\n  python: python3\nrepos:\n- repo: local\n  hooks: []\n"
+        )
+        cfg2 = self.write_precommit_cfg(
+            "cfg2.yaml", "default_language_version:\n  python: python3\nrepos:\n- repo: meta\n  hooks: []\n"
+        )
+        merged_cfg = pre_commit_vauxoo.merge_precommit_cfgs([cfg1, cfg2])
+        self.assertEqual([repo["repo"] for repo in merged_cfg["repos"]], ["local", "meta"], "Repos not merged")
+        self.assertEqual(merged_cfg["default_language_version"], {"python": "python3"})
+
+        merged_path = os.path.join(self.tmp_dir, "merged.yaml")
+        pre_commit_vauxoo.save_precommit_cfg(merged_cfg, merged_path)
+        self.assertEqual(pre_commit_vauxoo.merge_precommit_cfgs([merged_path]), merged_cfg, "Merged cfg not saved")
+
+    def test_merge_precommit_cfgs_not_merged(self):
+        cfg1 = self.write_precommit_cfg(
+            "cfg1.yaml", "default_language_version:\n  python: python3\nrepos:\n- repo: local\n  hooks: []\n"
+        )
+        cfg_missing = os.path.join(self.tmp_dir, "missing.yaml")
+        self.assertIsNone(pre_commit_vauxoo.merge_precommit_cfgs([cfg1, cfg_missing]), "Missing file merged")
+        cfg_error = self.write_precommit_cfg("cfg_error.yaml", "repos: [\n")
+        self.assertIsNone(pre_commit_vauxoo.merge_precommit_cfgs([cfg1, cfg_error]), "Invalid yaml merged")
+        cfg_language = self.write_precommit_cfg(
+            "cfg_language.yaml", "default_language_version:\n  python: python2\nrepos:\n- repo: meta\n  hooks: []\n"
+        )
+        self.assertIsNone(
+            pre_commit_vauxoo.merge_precommit_cfgs([cfg1, cfg_language]), "Different default_language_version merged"
+        )
+
+    def test_split_files_cmds(self):
+        cmd = ["pre-commit", "run"]
+        self.assertEqual(
+            pre_commit_vauxoo.split_files_cmds(cmd, ["b.py", "a.py", "b.py"]),
+            [["pre-commit", "run", "--files", "b.py", "a.py"]],
+            "Duplicated files not removed keeping the order",
+        )
+        # Each argument uses its length + NUL + 8 of argv pointer so the command with "--files" uses 47
+        # and each file uses 14. Only 2 files fit in each chunk
+        with mock.patch.object(pre_commit_vauxoo, "get_arg_max", return_value=47 + 14 * 2):
+            cmds = pre_commit_vauxoo.split_files_cmds(cmd, ["a1.py", "a2.py", "a3.py", "a2.py", "a4.py", "a5.py"])
+        self.assertEqual(
+            cmds,
+            [
+                ["pre-commit", "run", "--files", "a1.py", "a2.py"],
+                ["pre-commit", "run", "--files", "a3.py", "a4.py"],
+                ["pre-commit", "run", "--files", "a5.py"],
+            ],
+            "Files not split in chunks",
+        )
+        # "-c" and "x.yaml" use 26 more and they are added to each chunk
+        with mock.patch.object(pre_commit_vauxoo, "get_arg_max", return_value=47 + 26 + 14 * 2):
+            cmds = pre_commit_vauxoo.get_run_cmds(cmd, ["a1.py", "a2.py", "a3.py"], "x.yaml")
+        self.assertEqual(
+            cmds,
+            [
+                ["pre-commit", "run", "--files", "a1.py", "a2.py", "-c", "x.yaml"],
+                ["pre-commit", "run", "--files", "a3.py", "-c", "x.yaml"],
+            ],
+            "Configuration file arguments not counted in the chunks",
+        )
+        self.assertEqual(
+            pre_commit_vauxoo.get_run_cmds(cmd, None, "x.yaml"), [["pre-commit", "run", "--all", "-c", "x.yaml"]]
+        )
+
+    def test_subprocess_call_cmds(self):
+        true_cmd = [sys.executable, "-c", "import sys; sys.exit(0)"]
+        false_cmd = [sys.executable, "-c", "import sys; sys.exit(3)"]
+        self.assertEqual(pre_commit_vauxoo.subprocess_call_cmds([true_cmd, true_cmd]), 0)
+        self.assertEqual(pre_commit_vauxoo.subprocess_call_cmds([false_cmd, true_cmd]), 3, "Failed chunk not returned")
+        exit_code, _output = pre_commit_vauxoo.subprocess_call_captured([true_cmd, false_cmd, true_cmd])
+        self.assertEqual(exit_code, 3, "Failed chunk not returned")
+
+    def test_envfile2envdict(self):
+        with open(os.path.join(self.tmp_dir, "variables.sh"), "w") as f_variables:
+            f_variables.write(
+                "# export COMMENTED=1\n"
+                'export VAR_DOUBLE="module_example1,module_autofix1"\n'
+                "export VAR_SINGLE='${HOME}/path:(1)'\n"
+                "EXPORT VAR_UPPER=1\n"
+                "export\tVAR_TAB\t=\t2\n"
+                "export VAR_EMPTY=\n"
+                "export VAR_UNICODE=/home/café/ñandú_²\n"
+                "export ÑANDÚ=2\n"
+                "export VAR_OVERWRITTEN=1\n"
+                "export VAR_OVERWRITTEN=2\n"
+                "export VAR_ENVIRON=new\n"
+                "export =no_variable\n"
+                "exportVAR_NO_SPACE=1\n"
+                "  export VAR_INDENTED=1\n"
+            )
+        os.environ["VAR_ENVIRON"] = "old"
+        expected = {
+            "VAR_DOUBLE": "module_example1,module_autofix1",
+            "VAR_SINGLE": "${HOME}/path:(1)",
+            "VAR_UPPER": "1",
+            "VAR_TAB": "2",
+            "VAR_EMPTY": "",
+            "VAR_UNICODE": "/home/café/ñandú_²",
+            "ÑANDÚ": "2",
+            "VAR_OVERWRITTEN": "2",
+        }
+        engines = [None]
+        if importlib.util.find_spec("re2"):
+            engines.append("re2")
+        for engine in engines:
+            # None in sys.modules raises ImportError using the "re" module instead of "re2"
+            with self.subTest(engine=engine or "re"), mock.patch.dict(sys.modules, {} if engine else {"re2": None}):
+                pre_commit_vauxoo.get_re_export.cache_clear()
+                self.assertEqual(pre_commit_vauxoo.envfile2envdict(self.tmp_dir), expected)
+                self.assertEqual(
+                    pre_commit_vauxoo.envfile2envdict(self.tmp_dir, no_overwrite_environ=False),
+                    dict(expected, VAR_ENVIRON="new"),
+                )
+        pre_commit_vauxoo.get_re_export.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()